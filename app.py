@@ -67,7 +67,14 @@ fernet = Fernet(FERNET_KEY)
 BASE_DIR = Path(__file__).resolve().parent
 IMAGES_DIR = BASE_DIR / "static" / "images"
 DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+RESPONSES_DIR = DATA_DIR / "responses"
+SURVEYS_DIR = DATA_DIR / "surveys"
+# Create output folders once at startup rather than on every save
+for _output_dir in (DATA_DIR, RESPONSES_DIR, SURVEYS_DIR):
+    _output_dir.mkdir(exist_ok=True)
+
+# Column order of the long-format participant CSV
+LONG_FORMAT_HEADERS = ("pid", "face_id", "version", "question", "response", "timestamp")
 
 # Load image list once at startup.
 # We accept any JPG/PNG in the folder and will present the SAME image three times
@@ -298,8 +305,7 @@ def save_encrypted_csv(pid: str, rows: list):
 def save_survey_responses(pid: str, survey_payload: dict):
     """Persist post-task survey responses for later export."""
     try:
-        surveys_dir = DATA_DIR / 'surveys'
-        surveys_dir.mkdir(exist_ok=True)
+        surveys_dir = SURVEYS_DIR
         timestamp = survey_payload.get('timestamp') or datetime.utcnow().isoformat()
         rows = []
 
@@ -342,6 +348,8 @@ def save_survey_responses(pid: str, survey_payload: dict):
 def convert_dict_to_long_format(participant_id, response_dict):
     """Convert nested session responses to strict long-format rows."""
     long_responses = []
+    # One clock read for every face that was stored without its own timestamp
+    fallback_timestamp = datetime.utcnow().isoformat()
 
     print(f"[csv] Processing {len(response_dict)} faces")
 
@@ -388,11 +396,21 @@ def convert_dict_to_long_format(participant_id, response_dict):
             print(f"[csv] Skipping {face_id} - not a dictionary")
             continue
 
-        face_timestamp = face_data.get("timestamp") or datetime.utcnow().isoformat()
+        face_timestamp = face_data.get("timestamp") or fallback_timestamp
         actual_pid = face_data.get("participant_id") or face_data.get("prolific_pid") or participant_id
         if not actual_pid or str(actual_pid).strip().upper() in {'UNKNOWN', 'UNKNOWN_PID', 'NAN'}:
             actual_pid = participant_id
 
+        # Fields shared by every row of this face; each row only overrides the per-question ones
+        face_row = {
+            "pid": actual_pid,
+            "face_id": face_id,
+            "version": None,
+            "question": None,
+            "response": None,
+            "timestamp": face_timestamp,
+        }
+
         for version, question_map in version_question_map.items():
             version_data = face_data.get(version)
             if not isinstance(version_data, dict):
@@ -409,12 +427,10 @@ def convert_dict_to_long_format(participant_id, response_dict):
                     continue
 
                 long_responses.append({
-                    "pid": actual_pid,
-                    "face_id": face_id,
+                    **face_row,
                     "version": output_version,
                     "question": question_label,
                     "response": response_value,
-                    "timestamp": face_timestamp,
                 })
 
     print(f"[csv] Final CSV rows = {len(long_responses)}")
@@ -516,8 +532,7 @@ def convert_wide_to_long_format(wide_responses: list) -> list:
 def save_participant_data_long(participant_id: str, responses: dict) -> str:
     """Save responses to CSV in strict LONG format (one row per question)."""
     try:
-        responses_dir = DATA_DIR / "responses"
-        responses_dir.mkdir(exist_ok=True)
+        responses_dir = RESPONSES_DIR
 
         base_id = participant_id or "anon"
         safe_id = base_id.replace(" ", "_").replace("/", "_").replace("\\", "_")
@@ -535,11 +550,14 @@ def save_participant_data_long(participant_id: str, responses: dict) -> str:
             print(f"       No valid responses after conversion to long format for participant {participant_id}")
             return None
 
-        headers = ["pid", "face_id", "version", "question", "response", "timestamp"]
-        with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(long_rows)
+        # Plain csv.writer over pre-ordered lists skips DictWriter's per-cell dict lookups;
+        # the whole file is formatted in memory, encoded once and handed to write_bytes,
+        # which opens, writes and closes in one call without the text-mode layer
+        csv_content = csv.StringIO()
+        writer = csv.writer(csv_content)
+        writer.writerow(LONG_FORMAT_HEADERS)
+        writer.writerows([[row[key] for key in LONG_FORMAT_HEADERS] for row in long_rows])
+        filepath.write_bytes(csv_content.getvalue().encode("utf-8"))
 
         print(f"    Exported long-format CSV for pid={participant_id}: {filepath}")
         return filepath
@@ -846,6 +864,7 @@ def task():
         data = session["sequence"][session["index"] // 2]
         face_id = data["face_id"]
         version = request.form["version"]
+        # Read the clock once per submission; every record below shares this stamp
         timestamp = datetime.utcnow().isoformat()
         
         # Get prolific PID from form or session
@@ -924,7 +943,7 @@ def task():
             if face_id not in session["responses"]:
                 session["responses"][face_id] = {
                     "participant_id": session["pid"],
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "face_id": face_id,
                     "prolific_pid": prolific_pid
                 }
@@ -949,7 +968,7 @@ def task():
         task_is_complete = total_steps > 0 and session["index"] >= total_steps
         if task_is_complete:
             session["session_complete"] = True
-            session["completion_timestamp"] = datetime.utcnow().isoformat()
+            session["completion_timestamp"] = timestamp
         else:
             session.pop("completion_timestamp", None)
         
@@ -974,7 +993,7 @@ def task():
                     backup_file = DATA_DIR / "sessions" / f"{session['pid']}_backup.json"
                     backup_data = {
                         "participant_id": session["pid"],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": timestamp,
                         "index": session["index"],
                         "face_order": session["face_order"],
                         "responses": session["responses"],
@@ -1095,13 +1114,26 @@ def done():
 if __name__ == "__main__":
     # Set default port to 3000
     port = 3000
+    # Waitress worker threads; FLASK_ENV=development keeps the Flask dev server
+    threads = int(os.environ.get("WAITRESS_THREADS", 8))
+    use_dev_server = os.environ.get("FLASK_ENV") == "development"
+    if not use_dev_server:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("Waitress not installed - falling back to the Flask development server")
+            use_dev_server = True
     print(f"Starting Facial Trust Study on port {port}")
     print(f"Study available at http://localhost:{port}")
     print("Using localhost binding for Windows compatibility")
     try:
         # Use 0.0.0.0 for both Render deployment and local development (allows localhost access)
         host = "0.0.0.0"
-        app.run(host=host, port=port, debug=False)
+        if use_dev_server:
+            app.run(host=host, port=port, debug=False)
+        else:
+            print(f"Serving with Waitress ({threads} threads)")
+            serve(app, host=host, port=port, threads=threads, channel_timeout=60)
     except OSError as e:
         if "Address already in use" in str(e):
             print(f"Port {port} is already in use. Please stop other services on this port.")
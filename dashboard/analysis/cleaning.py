@@ -26,6 +26,9 @@ class DataCleaner:
     """
     Data cleaning and exclusion logic for face perception study data.
     """
+
+    # Long-format columns with only a handful of distinct values, see load_data(categorical=True)
+    CATEGORICAL_COLUMNS = ('pid', 'version', 'question')
     
     def __init__(self, data_dir: str = "data/responses", mode: str = "PRODUCTION"):
         self.data_dir = Path(data_dir)
@@ -37,6 +40,7 @@ class DataCleaner:
         self.exclusion_summary = {}
         self.production_fallback_used = False
         self.promoted_files: Set[str] = set()
+        self.categorical = False
     
     @staticmethod
     def _is_test_file(file_name: str) -> bool:
@@ -52,8 +56,20 @@ class DataCleaner:
         return any(keyword in lowered for keyword in extra_keywords)
 
 
-    def load_data(self) -> pd.DataFrame:
-        """Load and merge CSV files from the responses directory respecting the selected mode."""
+    def load_data(self, categorical: bool = False) -> pd.DataFrame:
+        """
+        Load and merge CSV files from the responses directory respecting the selected mode.
+
+        Args:
+            categorical: Store the low-cardinality CATEGORICAL_COLUMNS as pandas
+                categoricals, in the loaded frame and again at the end of
+                standardize_data, so the cleaned frame keeps them either way.
+                Each cell becomes a small integer code into one shared table of
+                labels, which shrinks the frame and lets value_counts/nunique
+                count codes instead of hashing strings. Off by default; grouping
+                on a categorical column should pass observed=True to skip labels
+                filtered out of a slice.
+        """
         csv_files = list(self.data_dir.glob('*.csv'))
 
         if not csv_files:
@@ -190,7 +206,19 @@ class DataCleaner:
         else:
             self.raw_data = pd.DataFrame()
 
+        self.categorical = categorical
+        if categorical:
+            # Convert after the concat: per-file categoricals with different
+            # label sets would fall back to object dtype when merged
+            self._to_categorical(self.raw_data)
+
         return self.raw_data
+
+    def _to_categorical(self, df: pd.DataFrame) -> None:
+        """Convert the CATEGORICAL_COLUMNS present in df to category dtype in place."""
+        for column in self.CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
     def get_data_summary(self) -> Dict:
         """Get summary of currently loaded data."""
         if self.raw_data is None:
@@ -454,6 +482,11 @@ class DataCleaner:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         
+        if self.categorical:
+            # The string normalization above turns question/version back into
+            # plain strings, so convert again once the labels are final
+            self._to_categorical(df)
+        
         self.raw_data = df
         return df
     
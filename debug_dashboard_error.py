@@ -3,11 +3,7 @@
 Debug script to capture the exact dashboard error with full stack trace
 """
 
-import sys
-import os
 import traceback
-sys.path.append('.')
-sys.path.append('dashboard')
 
 def debug_dashboard():
     try:
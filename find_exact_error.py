@@ -3,25 +3,28 @@
 Find the exact line causing the dashboard error
 """
 
-import sys
-import os
+import functools
 import traceback
-sys.path.append('.')
-sys.path.append('dashboard')
+
+@functools.lru_cache(maxsize=1)
+def get_cleaner():
+    """Load and clean the response CSVs once; every probe shares the result"""
+    from dashboard.analysis.cleaning import DataCleaner
+    
+    print("Testing DataCleaner...")
+    cleaner = DataCleaner()
+    
+    print("Loading data...")
+    cleaner.load_data()
+    
+    print("Getting cleaned data...")
+    cleaner.get_cleaned_data()
+    return cleaner
 
 def test_data_loading():
     """Test data loading to find the comparison error"""
     try:
-        from dashboard.analysis.cleaning import DataCleaner
-        
-        print("Testing DataCleaner...")
-        cleaner = DataCleaner()
-        
-        print("Loading data...")
-        cleaner.load_data()
-        
-        print("Getting cleaned data...")
-        cleaned_data = cleaner.get_cleaned_data()
+        get_cleaner()
         
         print("Data loaded successfully")
         return True
@@ -35,13 +38,9 @@ def test_stats_calculation():
     """Test statistics calculation"""
     try:
         from dashboard.analysis.stats import StatisticalAnalyzer
-        from dashboard.analysis.cleaning import DataCleaner
-        
-        cleaner = DataCleaner()
-        cleaner.load_data()
         
         print("Testing StatisticalAnalyzer...")
-        analyzer = StatisticalAnalyzer(cleaner.get_cleaned_data())
+        analyzer = StatisticalAnalyzer(get_cleaner())
         
         print("Getting image summary...")
         images = analyzer.get_image_summary()
@@ -58,13 +57,9 @@ def test_filters():
     """Test filters"""
     try:
         from dashboard.analysis.filters import FilterManager
-        from dashboard.analysis.cleaning import DataCleaner
-        
-        cleaner = DataCleaner()
-        cleaner.load_data()
         
         print("Testing FilterManager...")
-        filter_mgr = FilterManager(cleaner.get_cleaned_data())
+        filter_mgr = FilterManager(get_cleaner())
         
         print("Getting available filters...")
         filters = filter_mgr.get_available_filters()
@@ -1,12 +1,16 @@
+import functools
 import subprocess
 import os
 
 os.chdir(r'C:\Users\Chris\CascadeProjects\facial-trust-study')
 
+# Run git directly (no intermediate shell) with the argument lists as-is
+run = functools.partial(subprocess.run, shell=False)
+
 # Force deploy the template changes
-subprocess.run(['git', 'add', 'dashboard/templates/base.html'], shell=True)
-subprocess.run(['git', 'commit', '-m', 'FORCE DEPLOY NAVIGATION FIX'], shell=True)
-result = subprocess.run(['git', 'push', 'origin', 'main'], shell=True, capture_output=True, text=True)
+run(['git', 'add', 'dashboard/templates/base.html'], check=True)
+run(['git', 'commit', '-m', 'FORCE DEPLOY NAVIGATION FIX'])
+result = run(['git', 'push', 'origin', 'main'], capture_output=True, text=True)
 
 print("DEPLOYMENT RESULT:")
 print(result.stdout)
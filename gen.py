@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Test Data Generator for Facial Trust Study
+
+One vectorized row builder shared by the production, test and
+single-participant generators. Each schema describes the questions asked per
+face and where the output goes:
+
+    python -m gen --schema production   # 60 participants, long format, no timestamps
+    python -m gen --schema test         # 60 participants, long format with timestamps
+    python -m gen --schema single       # test_001 only, one wide row per face
+
+generate_production_data.py, generate_test_data.py and generate_single_test.py
+are thin wrappers around the matching schema.
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+OUTPUT_DIR = Path("data/responses")
+
+# gzip level 1 trades a little size for near-raw write speed
+GZIP_FAST = {'method': 'gzip', 'compresslevel': 1}
+
+# Response options
+MASCULINITY_CHOICES = ["Left", "Right", "Both Equally", "Neither"]
+FEMININITY_CHOICES = ["Left", "Right", "Both Equally", "Neither"]
+
+
+@dataclass(frozen=True)
+class Draw:
+    """How the responses to one question are drawn: an integer range or a set of choices."""
+    low: int = 1
+    high: int = 9
+    choices: tuple = ()
+
+    def sample(self, rng, size):
+        if self.choices:
+            return rng.choice(self.choices, size=size)
+        return rng.integers(self.low, self.high + 1, size=size)
+
+
+LIKERT = Draw(1, 9)
+
+
+@dataclass(frozen=True)
+class Timing:
+    """
+    Timestamp model: a participant starts start_back start_units ago, each face
+    is shown face_delay face_units after the previous face ended, and a face
+    ends 30-120 seconds after it was shown.
+    """
+    start_back: tuple
+    start_unit: timedelta
+    face_delay: tuple
+    face_unit: timedelta
+
+
+@dataclass(frozen=True)
+class Schema:
+    """
+    Output layout for a generator.
+
+    Long-format schemas map (version, question) to a Draw and produce one row
+    per response; wide schemas map column name to a Draw and produce one row
+    per face, followed by the constant columns.
+    """
+    long_format: bool
+    columns: dict
+    num_participants: int = 60
+    num_faces: int = 35
+    timing: Optional[Timing] = None
+    constants: dict = field(default_factory=dict)
+    output_file: Optional[str] = None
+    individual_files: bool = True
+
+
+SCHEMAS = {
+    # One row per response, no timestamps (generate_production_data.py)
+    'production': Schema(
+        long_format=True,
+        columns={
+            # Phase 1: Half-Face Ratings (6 responses)
+            ('left', 'trust'): LIKERT,
+            ('left', 'emotion'): LIKERT,
+            ('right', 'trust'): LIKERT,
+            ('right', 'emotion'): LIKERT,
+            ('both', 'masc_choice'): Draw(choices=('left', 'right', 'both', 'neither')),
+            ('both', 'fem_choice'): Draw(choices=('left', 'right', 'both', 'neither')),
+            # Phase 2: Full-Face Ratings (4 responses)
+            ('both', 'trust'): LIKERT,
+            ('both', 'emotion'): LIKERT,
+            ('both', 'masculinity_full'): LIKERT,
+            ('both', 'femininity_full'): LIKERT,
+        },
+        output_file='all_participants_combined.csv',
+    ),
+    # One row per response with per-question timestamps (generate_test_data.py)
+    'test': Schema(
+        long_format=True,
+        columns={
+            ('left', 'trust_rating'): LIKERT,
+            ('left', 'emotion_rating'): LIKERT,
+            ('right', 'trust_rating'): LIKERT,
+            ('right', 'emotion_rating'): LIKERT,
+            ('both', 'trust_rating'): LIKERT,
+            ('both', 'emotion_rating'): LIKERT,
+            ('both', 'masc_choice'): Draw(choices=('left', 'right')),
+            ('both', 'fem_choice'): Draw(choices=('left', 'right', 'neither')),
+            ('both', 'masculinity'): Draw(choices=('left', 'right')),
+            ('both', 'femininity'): Draw(choices=('left', 'right')),
+        },
+        timing=Timing((1, 48), timedelta(hours=1), (30, 120), timedelta(seconds=1)),
+        output_file='test_participants_combined.csv',
+    ),
+    # One wide row per face for a single participant (generate_single_test.py)
+    'single': Schema(
+        long_format=False,
+        columns={
+            # Phase 1: Half-face ratings
+            'trust_left': LIKERT,
+            'emotion_left': LIKERT,
+            'trust_right': LIKERT,
+            'emotion_right': LIKERT,
+            'masc_choice': Draw(choices=tuple(MASCULINITY_CHOICES)),
+            'fem_choice': Draw(choices=tuple(FEMININITY_CHOICES)),
+            # Phase 2: Full-face ratings
+            'trust_rating': LIKERT,
+            'emotion_rating': LIKERT,
+            'masculinity_full': LIKERT,
+            'femininity_full': LIKERT,
+            # Additional required fields for dashboard compatibility
+            'response_time': Draw(2000, 8000),  # milliseconds
+            'version': Draw(choices=('A', 'B')),
+        },
+        num_participants=1,
+        timing=Timing((1, 7), timedelta(days=1), (1, 15), timedelta(minutes=1)),
+        constants={'include_in_primary': True, 'session_complete': True},
+        output_file='single_test_participant.csv',
+        individual_files=False,
+    ),
+}
+
+
+def draw_columns(columns, shape, rng):
+    """Sample every column, drawing all columns that share a Draw in one batched call."""
+    keys_by_draw = {}
+    for key, draw in columns.items():
+        keys_by_draw.setdefault(draw, []).append(key)
+
+    draws = {}
+    for draw, keys in keys_by_draw.items():
+        values = draw.sample(rng, shape + (len(keys),))
+        for i, key in enumerate(keys):
+            draws[key] = values[..., i]
+    return {key: draws[key] for key in columns}
+
+
+@lru_cache(maxsize=None)
+def face_id_names(num_faces):
+    """Return the face ids face_01..face_NN, built once per face count."""
+    return tuple(f"face_{i:02d}" for i in range(1, num_faces + 1))
+
+
+def face_timestamps(timing, num_participants, num_faces, rng):
+    """Return a (participants, faces) datetime64 array of face presentation times."""
+    now = np.datetime64(datetime.now(), 'us')
+    start = now - rng.integers(timing.start_back[0], timing.start_back[1] + 1,
+                               size=(num_participants, 1)) * np.timedelta64(timing.start_unit)
+    delays = rng.integers(timing.face_delay[0], timing.face_delay[1] + 1,
+                          size=(num_participants, num_faces)) * np.timedelta64(timing.face_unit)
+    gaps = rng.integers(30, 121, size=(num_participants, num_faces)) * np.timedelta64(1, 's')
+    # Each face waits for its own delay plus the gaps after every earlier face
+    elapsed = delays.cumsum(axis=1)
+    elapsed[:, 1:] += gaps[:, :-1].cumsum(axis=1)
+    return start + elapsed
+
+
+def generate(schema, num_participants=None, num_faces=None, seed=None):
+    """Generate a DataFrame for every participant × face in the given schema."""
+    num_participants = num_participants or schema.num_participants
+    num_faces = num_faces or schema.num_faces
+    rng = np.random.default_rng(seed)
+
+    pids = np.array([f"test_{i:03d}" for i in range(1, num_participants + 1)])
+    face_ids = np.array(face_id_names(num_faces))
+    shape = (num_participants, num_faces)
+    draws = draw_columns(schema.columns, shape, rng)
+    timestamps = face_timestamps(schema.timing, *shape, rng) if schema.timing else None
+
+    if not schema.long_format:
+        data = {
+            'pid': np.repeat(pids, num_faces),
+            'face_id': np.tile(face_ids, num_participants),
+        }
+        if timestamps is not None:
+            data['timestamp'] = np.datetime_as_string(timestamps.ravel(), unit='us')
+        data.update((column, values.ravel()) for column, values in draws.items())
+        data.update(schema.constants)
+        return pd.DataFrame(data)
+
+    # Long format: rows ordered participant -> face -> question
+    num_questions = len(schema.columns)
+    responses = np.empty(shape + (num_questions,), dtype=object)
+    for q, values in enumerate(draws.values()):
+        responses[:, :, q] = values.tolist()
+    versions, questions = zip(*schema.columns)
+
+    data = {
+        'pid': np.repeat(pids, num_faces * num_questions),
+        'face_id': np.tile(np.repeat(face_ids, num_questions), num_participants),
+        'version': np.tile(versions, num_participants * num_faces),
+        'question': np.tile(questions, num_participants * num_faces),
+        'response': responses.ravel(),
+    }
+    if timestamps is not None:
+        # Questions for a face are answered one second apart
+        offsets = np.arange(num_questions) * np.timedelta64(1, 's')
+        data['timestamp'] = np.datetime_as_string((timestamps[:, :, None] + offsets).ravel(), unit='us')
+    return pd.DataFrame(data)
+
+
+def write_csv(df, path, compress=False):
+    """Write df without its index, as <path>.gz when compress is set; returns the path written."""
+    path = Path(path)
+    if compress:
+        path = path.with_name(path.name + '.gz')
+        df.to_csv(path, index=False, compression=GZIP_FAST)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def save_individual_csvs(df, output_dir=OUTPUT_DIR, compress=False):
+    """Save each participant's rows as data/responses/<pid>.csv (or .csv.gz)."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Slice the combined frame per participant instead of re-materializing rows
+    groups = df.groupby('pid', sort=False)
+    print(f"💾 Saving {groups.ngroups} individual CSV files...")
+    for participant_id, participant_data in groups:
+        write_csv(participant_data, output_path / f"{participant_id}.csv", compress)
+
+    print(f"✅ Individual files saved to {output_dir}/")
+
+
+def verify_data_structure(df, schema):
+    """Print a summary of the generated data and check per-participant counts."""
+    print(f"\n🔍 Data Structure Verification:")
+    print(f"   Total rows: {len(df)}")
+    print(f"   Unique participants: {df['pid'].nunique()}")
+    print(f"   Unique faces: {df['face_id'].nunique()}")
+    if schema.long_format:
+        print(f"   Unique versions: {df['version'].unique()}")
+        print(f"   Unique questions: {df['question'].unique()}")
+
+    rows_per_participant = df.groupby('pid').size()
+    if rows_per_participant.nunique() == 1:
+        print(f"   ✅ All participants have {rows_per_participant.iloc[0]} rows")
+    else:
+        print(f"   ❌ Inconsistent row counts across participants")
+
+
+def main(schema_name, num_participants=None, num_faces=None, seed=None, output_dir=OUTPUT_DIR,
+         compress=False):
+    """
+    Generate, verify and save the data for one schema.
+
+    compress writes gzip'd .csv.gz files; the dashboard only picks up plain
+    *.csv files, so leave it off for data meant to be loaded there.
+    """
+    schema = SCHEMAS[schema_name]
+    print(f"🚀 Generating '{schema_name}' test data")
+    print("=" * 60)
+
+    df = generate(schema, num_participants, num_faces, seed)
+    verify_data_structure(df, schema)
+
+    if schema.individual_files:
+        save_individual_csvs(df, output_dir, compress)
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    output_file = write_csv(df, output_path / schema.output_file, compress)
+    print(f"📊 Combined data saved to: {output_file}")
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate facial trust study test data.')
+    parser.add_argument('--schema', choices=sorted(SCHEMAS), default='test', help='Output layout to generate.')
+    parser.add_argument('--participants', type=int, default=None, help='Override the number of participants.')
+    parser.add_argument('--faces', type=int, default=None, help='Override the number of faces.')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducibility.')
+    parser.add_argument('--compress', action='store_true', help='Write gzip-compressed .csv.gz files.')
+    args = parser.parse_args()
+
+    main(args.schema, args.participants, args.faces, args.seed, compress=args.compress)
@@ -1,54 +1,63 @@
 """Generate random long-format test CSV files for the dashboard."""
 import argparse
-import csv
-import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat, starmap
 from pathlib import Path
 
+import numpy as np
+
 DATA_DIR = Path('data') / 'responses'
 
 LEFT_RIGHT_QUESTIONS = ['trust_rating', 'emotion_rating']
 FULL_FACE_NUMERIC = ['trust_rating', 'emotion_rating', 'masculinity_full', 'femininity_full']
 CHOICE_QUESTIONS = ['masc_choice', 'fem_choice']
 CHOICE_OPTIONS = ['left', 'right', 'neither']
-
-
-def generate_participant(index: int, seed: int = None) -> Path:
-    rng = random.Random(seed)
+NUM_FACES = 35
+FACE_IDS = tuple(f"face ({face_num})" for face_num in range(1, NUM_FACES + 1))
+
+# (version, question) order of the numeric rows written for each face
+NUMERIC_LAYOUT = [(version, question) for version in ['left', 'right'] for question in LEFT_RIGHT_QUESTIONS]
+NUMERIC_LAYOUT += [('both', question) for question in FULL_FACE_NUMERIC]
+# Emotion is rated 1-9; trust and masculinity/femininity are rated 1-7
+NUMERIC_MAX = np.array([9 if question == 'emotion_rating' else 7 for _, question in NUMERIC_LAYOUT])
+
+# Every participant file has the same face/version/question columns; only the
+# responses differ, so those columns are laid out once for all participants
+ROW_LAYOUT = NUMERIC_LAYOUT + [('both', question) for question in CHOICE_QUESTIONS]
+FACE_COLUMN = np.repeat(FACE_IDS, len(ROW_LAYOUT)).tolist()
+VERSION_COLUMN = np.tile([version for version, _ in ROW_LAYOUT], NUM_FACES).tolist()
+QUESTION_COLUMN = np.tile([question for _, question in ROW_LAYOUT], NUM_FACES).tolist()
+
+# Every field is a plain id, choice, integer or ISO timestamp, so nothing ever
+# needs quoting; rows are formatted straight to text in csv.writer's dialect
+CSV_HEADER = 'pid,face_id,version,question,response,timestamp\r\n'
+ROW_FORMAT = '{},{},{},{},{},{}\r\n'
+
+
+def draw_participant(index: int, rng: np.random.Generator):
+    """Draw one participant's responses; returns (csv path, rows) ready for write_participant."""
     participant_id = f"TEST_R{index:03d}"
     timestamp = datetime.utcnow().isoformat()
     suffix = participant_id.replace('TEST_', '')
     filename = DATA_DIR / f"TEST_{suffix}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    with filename.open('w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['pid', 'face_id', 'version', 'question', 'response', 'timestamp'])
-
-        for face_num in range(1, 36):
-            face_id = f"face ({face_num})"
-
-            for version in ['left', 'right']:
-                for question in LEFT_RIGHT_QUESTIONS:
-                    if question == 'trust_rating':
-                        response = rng.randint(1, 7)
-                    else:  # emotion rating
-                        response = rng.randint(1, 9)
-                    writer.writerow([participant_id, face_id, version, question, response, timestamp])
-
-            # full face block
-            for question in FULL_FACE_NUMERIC:
-                if question in ['trust_rating']:
-                    response = rng.randint(1, 7)
-                elif question in ['emotion_rating']:
-                    response = rng.randint(1, 9)
-                else:  # masculinity/femininity
-                    response = rng.randint(1, 7)
-                writer.writerow([participant_id, face_id, 'both', question, response, timestamp])
-
-            for question in CHOICE_QUESTIONS:
-                response = rng.choice(CHOICE_OPTIONS)
-                writer.writerow([participant_id, face_id, 'both', question, response, timestamp])
+    # Draw every response for this participant up front into one faces x questions grid
+    responses = np.empty((NUM_FACES, len(ROW_LAYOUT)), dtype=object)
+    responses[:, :len(NUMERIC_LAYOUT)] = rng.integers(1, NUMERIC_MAX + 1, size=(NUM_FACES, len(NUMERIC_LAYOUT))).tolist()
+    responses[:, len(NUMERIC_LAYOUT):] = rng.choice(CHOICE_OPTIONS, size=(NUM_FACES, len(CHOICE_QUESTIONS))).tolist()
+
+    # Row-major ravel lines the grid up with the precomputed columns
+    rows = zip(repeat(participant_id), FACE_COLUMN, VERSION_COLUMN, QUESTION_COLUMN,
+               responses.ravel().tolist(), repeat(timestamp))
+    return filename, rows
+
+
+def write_participant(filename: Path, rows) -> Path:
+    """Write the rows from draw_participant to filename as a long-format CSV."""
+    # Format the whole file in memory and hand it to the OS in a single write
+    content = CSV_HEADER + ''.join(starmap(ROW_FORMAT.format, rows))
+    filename.write_text(content, encoding='utf-8', newline='')
 
     return filename
 
@@ -57,12 +66,16 @@ def main():
     parser = argparse.ArgumentParser(description='Generate random long-format test CSV files for the dashboard.')
     parser.add_argument('--count', type=int, default=10, help='Number of test participants to generate.')
     parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducibility.')
+    parser.add_argument('--workers', type=int, default=4, help='Number of files written concurrently.')
     args = parser.parse_args()
 
-    base_seed = args.seed if args.seed is not None else random.randrange(1_000_000)
-    created_files = []
-    for i in range(1, args.count + 1):
-        created_files.append(generate_participant(i, seed=base_seed + i))
+    rng = np.random.default_rng(args.seed)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Draws stay sequential on the shared generator so seeded output is unchanged;
+    # the independent file writes overlap on a small thread pool
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(write_participant, *draw_participant(i, rng)) for i in range(1, args.count + 1)]
+        created_files = [future.result() for future in futures]
 
     print(f'Generated {len(created_files)} test files in {DATA_DIR.resolve()}')
 
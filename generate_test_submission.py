@@ -3,7 +3,7 @@
 Generate test submission with proper 10-row long format
 """
 
-import pandas as pd
+import csv
 import time
 from pathlib import Path
 
@@ -24,17 +24,20 @@ def generate_test_submission(pid='TEST', face_id='face(1)'):
         [pid, face_id, 'both',  'emotion_rating', 1, timestamp],
     ]
     
-    df = pd.DataFrame(data, columns=['pid', 'face_id', 'version', 'question', 'response', 'timestamp'])
+    columns = ['pid', 'face_id', 'version', 'question', 'response', 'timestamp']
     
     # Ensure data/responses directory exists
     Path('data/responses').mkdir(parents=True, exist_ok=True)
     
     filepath = f'data/responses/{pid}_{timestamp}.csv'
-    df.to_csv(filepath, index=False)
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(data)
     
     print(f"Generated test submission: {filepath}")
-    print(f"Rows: {len(df)}")
-    print(df.to_string(index=False))
+    print(f"Rows: {len(data)}")
+    print('\n'.join(' '.join(str(value) for value in row) for row in [columns] + data))
     
     return filepath
 
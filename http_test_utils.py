@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the HTTP test scripts that drive the study on localhost:3000
+"""
+
+import os
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def pooled_session():
+    """A keep-alive session (cookies included) for every request of one simulated participant."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                         max_retries=Retry(total=2, backoff_factor=0.1)))
+    return session
+
+def list_csvs(dir_path):
+    """Names of the CSV files in dir_path, from a single directory scan."""
+    if not os.path.isdir(dir_path):
+        return []
+    with os.scandir(dir_path) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(".csv")]
+
+def wait_for_csv(dir_path, pid, timeout=3.0, interval=0.05):
+    """
+    Poll dir_path until a CSV naming pid appears, giving up after timeout seconds.
+    Returns (matching paths, every CSV name from the last scan).
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        names = list_csvs(dir_path)
+        matches = [dir_path / name for name in names if pid in name]
+        if matches or time.monotonic() >= deadline:
+            return matches, names
+        time.sleep(interval)
+
+def newest_file(paths):
+    """The most recently modified of paths, or None when there are none."""
+    return max(paths, key=lambda path: path.stat().st_mtime_ns, default=None)
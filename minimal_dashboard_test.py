@@ -3,11 +3,7 @@
 Minimal test to isolate the exact dashboard error
 """
 
-import sys
-import os
 import traceback
-sys.path.append('.')
-sys.path.append('dashboard')
 
 # Test each component step by step
 def test_step_by_step():
@@ -1,8 +1,8 @@
 from pathlib import Path
+import ast
 import re
 path = Path("app.py")
 text = path.read_text(encoding="utf-8")
-pattern = re.compile(r"@app.route\(\"/\"\)\ndef landing\(\):.*?@app.route\(\"/instructions\"\)", re.S)
 replacement = '''@app.route("/")
 def landing():
     # Force consent first
@@ -28,11 +28,30 @@ def landing():
         with open("error.log", "a", encoding="utf-8") as log_file:
             log_file.write("[landing] " + str(e) + "\n")
             traceback.print_exc(file=log_file)
-        raise
+        raise'''
 
-@app.route("/instructions")
-def instructions():'''
-new_text, count = pattern.subn(replacement, text)
+
+def splice_with_ast(text):
+    """Replace landing() (decorators included) using the line span reported by the parser."""
+    tree = ast.parse(text)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "landing":
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1
+            lines = text.splitlines(keepends=True)
+            return "".join(lines[:start]) + replacement + "\n" + "".join(lines[node.end_lineno:]), 1
+    return text, 0
+
+
+def splice_with_regex(text):
+    """Fallback for an app.py that does not parse: landing() runs up to the /instructions route."""
+    pattern = re.compile(r"@app.route\(\"/\"\)\ndef landing\(\):.*?(?=@app.route\(\"/instructions\"\))", re.S)
+    return pattern.subn(lambda match: replacement + "\n\n", text, count=1)
+
+
+try:
+    new_text, count = splice_with_ast(text)
+except SyntaxError:
+    new_text, count = splice_with_regex(text)
 if count == 0:
     raise SystemExit('landing block not found')
-path.write_text(new_text, encoding="utf-8")
+path.write_text(new_text, encoding="utf-8")
@@ -6,10 +6,10 @@ import subprocess
 import sys
 
 def run_command(cmd):
-    """Run a command and return the result"""
+    """Run a command (argument list, no shell) and return the result"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        print(f"Running: {cmd}")
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        print(f"Running: {' '.join(cmd)}")
         if result.stdout:
             print(f"Output: {result.stdout}")
         if result.stderr:
@@ -24,16 +24,16 @@ def main():
     print("🚀 Pushing watchdog fix to GitHub...")
     
     # Add all files
-    if not run_command("git add ."):
+    if not run_command(["git", "add", "."]):
         print("❌ Failed to add files")
         return
     
     # Commit changes
-    if not run_command('git commit -m "FIX: Make watchdog import optional for Render deployment"'):
+    if not run_command(["git", "commit", "-m", "FIX: Make watchdog import optional for Render deployment"]):
         print("❌ Failed to commit (might be no changes)")
     
     # Push to GitHub
-    if not run_command("git push origin main"):
+    if not run_command(["git", "push", "origin", "main"]):
         print("❌ Failed to push to GitHub")
         return
     
@@ -7,8 +7,8 @@ os.chdir(r'C:\Users\Chris\CascadeProjects\facial-trust-study')
 
 def run_cmd(cmd):
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        print(f"Command: {cmd}")
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        print(f"Command: {' '.join(cmd)}")
         print(f"Output: {result.stdout}")
         if result.stderr:
             print(f"Error: {result.stderr}")
@@ -20,9 +20,9 @@ def run_cmd(cmd):
 print("🔧 Pushing navigation fixes to fix 404 errors...")
 
 # Add the navigation template fix
-run_cmd("git add dashboard/templates/base.html")
-run_cmd('git commit -m "CRITICAL FIX: Use url_for() in navigation to fix 404 errors in unified deployment"')
-run_cmd("git push origin main")
+run_cmd(["git", "add", "dashboard/templates/base.html"])
+run_cmd(["git", "commit", "-m", "CRITICAL FIX: Use url_for() in navigation to fix 404 errors in unified deployment"])
+run_cmd(["git", "push", "origin", "main"])
 
 print("✅ Navigation fixes pushed!")
 print("🔄 Render will redeploy and fix the 404 errors")
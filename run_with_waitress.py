@@ -11,6 +11,7 @@ try:
     import app
     
     PORT = int(os.environ.get("PORT", 3000))
+    THREADS = int(os.environ.get("WAITRESS_THREADS", 8))
     
     print("🎯 Starting Facial Trust Study with Waitress WSGI Server")
     print(f"📍 URL: http://localhost:{PORT}")
@@ -18,7 +19,7 @@ try:
     print("=" * 50)
     
     # Serve the Flask app using waitress
-    serve(app.app, host="127.0.0.1", port=PORT)
+    serve(app.app, host="127.0.0.1", port=PORT, threads=THREADS, channel_timeout=60)
     
 except ImportError:
     print("❌ Waitress not installed. Installing...")
@@ -2,20 +2,34 @@
 """
 Automate running through the study as a participant.
 Usage: python scripts/auto_participant.py --pid 400
+       python scripts/auto_participant.py --pid 400 --participants 20   # pids 400_1 .. 400_20, concurrently
 """
 import argparse
+import functools
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except Exception:
     print('The requests library is required. Install with: pip install requests')
     raise
 
+# Hidden version field on the task page, and the marker of the full-face form.
+# Matched against the raw response bytes so the page never has to be decoded.
+_VERSION_RE = re.compile(rb"""name=["']version["']\s+value=["']([^"']+)["']""")
+_TRUST_FULL_MARKERS = (b'name="trust_full"', b"name='trust_full'")
 
-def run_participant(base_url: str, pid: str):
+
+def run_participant(base_url: str, pid: str, delay: float = 0.0):
     s = requests.Session()
+    # The walkthrough is strictly sequential against one host: keep a single
+    # keep-alive connection hot and fail fast instead of retrying
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    s.mount('http://', adapter)
+    s.mount('https://', adapter)
     print('GET /')
     r = s.get(base_url + '/')
     print('->', r.status_code, r.url)
@@ -47,13 +61,13 @@ def run_participant(base_url: str, pid: str):
             print('Unexpected status for /task:', r.status_code)
             break
 
-        html = r.text
+        html = r.content
         # determine version
-        m = re.search(r"name=[\"']version[\"']\s+value=[\"']([^\"']+)[\"']", html)
-        version = m.group(1) if m else None
+        m = _VERSION_RE.search(html) if b'version' in html else None
+        version = m.group(1).decode() if m else None
         if not version:
             # fallback heuristics
-            if 'name="trust_full"' in html or 'name=\'trust_full\'' in html:
+            if any(marker in html for marker in _TRUST_FULL_MARKERS):
                 version = 'full'
             else:
                 version = 'toggle'
@@ -79,13 +93,17 @@ def run_participant(base_url: str, pid: str):
             }
 
         print('POST /task', {k: v for k, v in data.items() if k in ('version', 'trust_full', 'trust_left')})
-        r = s.post(base_url + '/task', data=data, allow_redirects=True)
-        print('->', r.status_code, r.url)
-        # small delay to avoid hammering
-        time.sleep(0.1)
-
-        # If after POST we landed on survey, break
-        if '/survey' in r.url:
+        # Don't follow the redirect: the next iteration GETs /task itself, and
+        # the Location header is enough to tell whether we reached the survey
+        r = s.post(base_url + '/task', data=data, allow_redirects=False)
+        location = r.headers.get('Location', '')
+        print('->', r.status_code, location)
+        # optional delay to avoid hammering a shared server
+        if delay:
+            time.sleep(delay)
+
+        # If the POST redirects to the survey, break
+        if '/survey' in location:
             print('Reached survey')
             break
 
@@ -110,13 +128,35 @@ def run_participant(base_url: str, pid: str):
     print('--- Done page end ---')
 
 
+def run_participants(base_url: str, pids, delay: float = 0.0, workers: int = None):
+    """Run one walkthrough per pid concurrently, each with its own Session.
+
+    The flows spend nearly all their time waiting on the server, so threads
+    let N participants overlap their round trips instead of queueing them.
+    """
+    pids = list(pids)
+    run = functools.partial(run_participant, base_url, delay=delay)
+    with ThreadPoolExecutor(max_workers=workers or len(pids)) as pool:
+        # list() re-raises the first failure from any participant
+        list(pool.map(run, pids))
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('--pid', default='400')
     p.add_argument('--host', default='http://localhost:3000')
+    p.add_argument('--delay', type=float, default=0.0, help='Seconds to wait between task posts')
+    p.add_argument('--participants', type=int, default=1,
+                   help='Number of concurrent participants; pids become <pid>_1 .. <pid>_N')
+    p.add_argument('--workers', type=int, default=None, help='Max concurrent flows (default: one per participant)')
     args = p.parse_args()
 
-    run_participant(args.host.rstrip('/'), args.pid)
+    base_url = args.host.rstrip('/')
+    if args.participants > 1:
+        pids = [f'{args.pid}_{i}' for i in range(1, args.participants + 1)]
+        run_participants(base_url, pids, args.delay, args.workers)
+    else:
+        run_participant(base_url, args.pid, args.delay)
 
 
 if __name__ == '__main__':
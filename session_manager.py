@@ -5,12 +5,22 @@ IRB-Approved Research - DO NOT MODIFY CRITICAL SYSTEMS
 This module provides safe session persistence without changing existing functionality.
 """
 
+import functools
 import json
 import os
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson is optional; it encodes/decodes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Session storage directory
 SESSIONS_DIR = Path(__file__).parent / "data" / "sessions"
 
@@ -36,6 +46,67 @@ def ensure_sessions_dir():
 # Initialize sessions directory
 _sessions_available = ensure_sessions_dir()
 
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize session data as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes written by _dumps."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Characters that cannot appear in a session filename
+_SAFE_ID_TRANS = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+@functools.lru_cache(maxsize=1024)
+def _session_path(sessions_dir: Path, participant_id: str) -> Path:
+    """Session file for a participant, with a filesystem-safe version of the ID."""
+    safe_id = participant_id.translate(_SAFE_ID_TRANS)
+    return sessions_dir / f"{safe_id}_session.json"
+
+def _write_session(session_file: Path, session_state: Dict[str, Any]) -> None:
+    """
+    Write via a temp file and os.replace so readers never see a partially written session.
+    
+    Each writer gets its own uniquely named temp file, so concurrent saves for the
+    same participant cannot truncate each other's data. The .tmp suffix keeps
+    in-flight files out of *.json globs.
+    """
+    with tempfile.NamedTemporaryFile(dir=session_file.parent, prefix=session_file.stem + ".",
+                                     suffix=".json.tmp", delete=False) as tmp:
+        tmp_file = Path(tmp.name)
+        try:
+            tmp.write(_dumps(session_state))
+        except BaseException:
+            tmp.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_file, session_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+# Last state written per participant, keyed on the file's (mtime, size) right after
+# the write, so follow-up updates skip re-reading the file only while it is unchanged
+_STATE_CACHE_SIZE = 256
+_state_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_state_lock = threading.Lock()
+
+def _file_version(stat_result: os.stat_result) -> tuple:
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+def _remember_state(participant_id: str, session_file: Path, session_state: Dict[str, Any]) -> None:
+    version = _file_version(session_file.stat())
+    with _state_lock:
+        _state_cache[participant_id] = (version, session_state)
+        _state_cache.move_to_end(participant_id)
+        if len(_state_cache) > _STATE_CACHE_SIZE:
+            _state_cache.popitem(last=False)
+
 def save_session_state(participant_id: str, session_data: Dict[str, Any]) -> bool:
     """
     Save current session state to file.
@@ -53,9 +124,7 @@ def save_session_state(participant_id: str, session_data: Dict[str, Any]) -> boo
             if not ensure_sessions_dir():
                 return False
                 
-        # Create a safe filename
-        safe_id = participant_id.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        session_file = SESSIONS_DIR / f"{safe_id}_session.json"
+        session_file = _session_path(SESSIONS_DIR, participant_id)
         
         # Prepare session data for saving
         session_state = {
@@ -74,8 +143,8 @@ def save_session_state(participant_id: str, session_data: Dict[str, Any]) -> boo
 
         
         # Save to JSON file
-        with open(session_file, 'w') as f:
-            json.dump(session_state, f, indent=2)
+        _write_session(session_file, session_state)
+        _remember_state(participant_id, session_file, session_state)
             
         print(f"✅ Session saved for participant {participant_id}")
         print(f"   📊 Saved {len(session_state.get('responses', []))} responses at index {session_state.get('index', 0)}")
@@ -97,16 +166,13 @@ def load_session_state(participant_id: str) -> Optional[Dict[str, Any]]:
         Dict containing session data or None if not found
     """
     try:
-        # Create a safe filename
-        safe_id = participant_id.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        session_file = SESSIONS_DIR / f"{safe_id}_session.json"
+        session_file = _session_path(SESSIONS_DIR, participant_id)
         
         if not session_file.exists():
             return None
             
         # Load session data
-        with open(session_file, 'r') as f:
-            session_state = json.load(f)
+        session_state = _loads(session_file.read_bytes())
             
         print(f"✅ Session loaded for participant {participant_id}")
         return session_state
@@ -126,42 +192,72 @@ def check_session_exists(participant_id: str) -> bool:
         bool: True if session exists, False otherwise
     """
     try:
-        safe_id = participant_id.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        session_file = SESSIONS_DIR / f"{safe_id}_session.json"
-        return session_file.exists()
+        return _session_path(SESSIONS_DIR, participant_id).exists()
     except:
         return False
 
-def mark_session_complete(participant_id: str) -> bool:
+def update_session_fields(participant_id: str, **changes: Any) -> bool:
     """
-    Mark a session as complete (when participant finishes the study).
+    Update fields of a saved session and write it back in one step.
+    
+    Uses the last state this process wrote for the participant while the
+    session file is unchanged since that write, and reads the file otherwise,
+    so deletions and writes from other processes are never overwritten.
     
     Args:
         participant_id: The participant ID
+        **changes: Session fields to set
         
     Returns:
-        bool: True if marked successfully, False otherwise
+        bool: True if updated successfully, False if no session exists or the write failed
     """
     try:
-        session_state = load_session_state(participant_id)
-        if session_state:
-            session_state["session_complete"] = True
-            session_state["completion_timestamp"] = datetime.utcnow().isoformat()
-            
-            safe_id = participant_id.replace(" ", "_").replace("/", "_").replace("\\", "_")
-            session_file = SESSIONS_DIR / f"{safe_id}_session.json"
-            
-            with open(session_file, 'w') as f:
-                json.dump(session_state, f, indent=2)
-                
-            print(f"✅ Session marked complete for participant {participant_id}")
-            return True
-        return False
+        session_file = _session_path(SESSIONS_DIR, participant_id)
+        try:
+            version = _file_version(session_file.stat())
+        except FileNotFoundError:
+            # Deleted (e.g. from the dashboard): never recreate it from the cache
+            with _state_lock:
+                _state_cache.pop(participant_id, None)
+            return False
+        
+        with _state_lock:
+            cached = _state_cache.get(participant_id)
+        if cached is not None and cached[0] == version:
+            session_state = cached[1]
+        else:
+            session_state = load_session_state(participant_id)
+            if not session_state:
+                return False
+        
+        session_state = {**session_state, **changes}
+        _write_session(session_file, session_state)
+        _remember_state(participant_id, session_file, session_state)
+        return True
         
     except Exception as e:
-        print(f"❌ Error marking session complete for {participant_id}: {e}")
+        print(f"❌ Error updating session for {participant_id}: {e}")
         return False
 
+def mark_session_complete(participant_id: str) -> bool:
+    """
+    Mark a session as complete (when participant finishes the study).
+    
+    Args:
+        participant_id: The participant ID
+        
+    Returns:
+        bool: True if marked successfully, False otherwise
+    """
+    marked = update_session_fields(
+        participant_id,
+        session_complete=True,
+        completion_timestamp=datetime.utcnow().isoformat()
+    )
+    if marked:
+        print(f"✅ Session marked complete for participant {participant_id}")
+    return marked
+
 def get_session_progress(participant_id: str) -> Optional[Dict[str, Any]]:
     """
     Get session progress information for display.
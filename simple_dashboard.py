@@ -3,18 +3,40 @@
 Simple dashboard that bypasses the complex initialization
 """
 
-from flask import Flask, render_template_string
+from flask import Flask, abort, request, send_from_directory
 import pandas as pd
 from pathlib import Path
-import sys
+from collections import deque
+import csv
+import functools
+import hmac
 import os
 
-# Add paths
-sys.path.append('.')
-sys.path.append('dashboard')
-
 app = Flask(__name__)
 
+DATA_DIR = Path('data/responses')
+RECENT_ROWS = 20
+
+# Raw response CSVs hold Prolific IDs, so downloads stay disabled unless a token
+# is configured; requests must send it in the X-Export-Token header
+EXPORT_TOKEN = os.environ.get('SIMPLE_DASHBOARD_EXPORT_TOKEN', '')
+
+# CSV listing of DATA_DIR, re-scanned only when the directory's mtime changes
+_dir_cache = {'mtime': None, 'files': []}
+
+# Response CSVs have a fixed long-format schema; when pyarrow is installed they are
+# read straight into Arrow with every column typed as a string (no type inference)
+RESPONSE_COLUMNS = ['pid', 'face_id', 'version', 'question', 'response', 'timestamp']
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    ARROW_CONVERT = pacsv.ConvertOptions(
+        column_types={column: pa.string() for column in RESPONSE_COLUMNS},
+        strings_can_be_null=True
+    )
+except ImportError:
+    pacsv = None
+
 # Simple HTML template
 TEMPLATE = """
 <!DOCTYPE html>
@@ -94,47 +116,113 @@ TEMPLATE = """
 </html>
 """
 
+# Compile the template once; render_template_string re-parses it on every request
+_TEMPLATE = app.jinja_env.from_string(TEMPLATE)
+
+def render_dashboard(**context):
+    return _TEMPLATE.render(**context)
+
+def _csv_files():
+    """CSV files in DATA_DIR; adding, removing or renaming a file bumps the directory mtime."""
+    try:
+        mtime = DATA_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if mtime != _dir_cache['mtime']:
+        _dir_cache.update(mtime=mtime, files=list(DATA_DIR.glob('*.csv')))
+    return _dir_cache['files']
+
+def _csv_fingerprint(csv_files):
+    """Name, mtime and size of every CSV; changes whenever a file is added, removed or rewritten."""
+    fingerprint = []
+    for file_path in csv_files:
+        stat = file_path.stat()
+        fingerprint.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(fingerprint))
+
+@functools.lru_cache(maxsize=4096)
+def _file_summary(name, mtime_ns, size):
+    """Row count and distinct participant/face IDs of one CSV, cached per file version."""
+    file_path = DATA_DIR / name
+    try:
+        if pacsv is not None:
+            table = pacsv.read_csv(file_path, convert_options=ARROW_CONVERT)
+            columns = table.column_names
+            pids = frozenset(table['pid'].drop_null().unique().to_pylist()) if 'pid' in columns else frozenset()
+            faces = frozenset(table['face_id'].drop_null().unique().to_pylist()) if 'face_id' in columns else frozenset()
+            return table.num_rows, pids, faces
+        
+        df = pd.read_csv(file_path)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return None
+    
+    pids = frozenset(df['pid'].dropna()) if 'pid' in df.columns else frozenset()
+    faces = frozenset(df['face_id'].dropna()) if 'face_id' in df.columns else frozenset()
+    return len(df), pids, faces
+
+def _recent_rows(fingerprint):
+    """Last RECENT_ROWS rows across the newest files, keeping only a bounded tail of each."""
+    recent = []
+    for name, _, _ in sorted(fingerprint, key=lambda entry: entry[1], reverse=True):
+        try:
+            with open(DATA_DIR / name, newline='', encoding='utf-8-sig') as f:
+                tail = deque(csv.DictReader(f), maxlen=RECENT_ROWS - len(recent))
+        except Exception as e:
+            print(f"Error reading {name}: {e}")
+            continue
+        recent[:0] = tail
+        if len(recent) >= RECENT_ROWS:
+            break
+    return recent
+
+@functools.lru_cache(maxsize=1)
+def _load_all(fingerprint):
+    """Dashboard stats and recent rows for the files in the fingerprint; cached until they change."""
+    summaries = [summary for summary in (_file_summary(*entry) for entry in fingerprint) if summary]
+    if not summaries:
+        return None
+    
+    # Calculate stats from the per-file summaries
+    stats = {
+        'total_responses': sum(rows for rows, _, _ in summaries),
+        'participants': len(frozenset().union(*(pids for _, pids, _ in summaries))),
+        'faces': len(frozenset().union(*(faces for _, _, faces in summaries))),
+        'files': len(fingerprint)
+    }
+    
+    return stats, _recent_rows(fingerprint)
+
 @app.route('/')
 @app.route('/dashboard/')
 def dashboard():
     try:
         # Load CSV data
-        data_dir = Path('data/responses')
-        csv_files = list(data_dir.glob('*.csv'))
+        csv_files = _csv_files()
         
         if not csv_files:
-            return render_template_string(TEMPLATE, error="No CSV files found")
+            return render_dashboard(error="No CSV files found")
         
-        # Load all data
-        all_data = []
-        for file_path in csv_files:
-            try:
-                df = pd.read_csv(file_path)
-                all_data.append(df)
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
+        loaded = _load_all(_csv_fingerprint(csv_files))
+        if loaded is None:
+            return render_dashboard(error="Could not load any data")
         
-        if not all_data:
-            return render_template_string(TEMPLATE, error="Could not load any data")
-        
-        # Combine data
-        combined = pd.concat(all_data, ignore_index=True)
-        
-        # Calculate stats
-        stats = {
-            'total_responses': len(combined),
-            'participants': combined['pid'].nunique() if 'pid' in combined.columns else 0,
-            'faces': combined['face_id'].nunique() if 'face_id' in combined.columns else 0,
-            'files': len(csv_files)
-        }
-        
-        # Get recent data (last 20 rows)
-        recent_data = combined.tail(20).to_dict('records')
-        
-        return render_template_string(TEMPLATE, stats=stats, recent_data=recent_data)
+        stats, recent_data = loaded
+        return render_dashboard(stats=stats, recent_data=recent_data)
         
     except Exception as e:
-        return render_template_string(TEMPLATE, error=f"Error: {str(e)}")
+        return render_dashboard(error=f"Error: {str(e)}")
+
+@app.route('/dashboard/export/<path:name>')
+def export_csv(name):
+    """Download one response CSV; the WSGI server's file_wrapper streams it without copying through Python."""
+    if not EXPORT_TOKEN:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('X-Export-Token', ''), EXPORT_TOKEN):
+        abort(403)
+    if not name.endswith('.csv'):
+        abort(404)
+    return send_from_directory(DATA_DIR.resolve(), name, as_attachment=True, conditional=True)
 
 if __name__ == '__main__':
     print("Starting dashboard on http://localhost:3000/dashboard/")
@@ -3,15 +3,15 @@
 Start dashboard on port 3000
 """
 
-import sys
 import os
-sys.path.append('.')
-sys.path.append('dashboard')
-
-from dashboard.dashboard_factory import create_dashboard_app
 
 if __name__ == "__main__":
+    # Imported here so tools that import this launcher skip the dashboard's pandas/scipy stack
+    from dashboard.dashboard_factory import create_dashboard_app
+
     app = create_dashboard_app()
     print("Starting dashboard on port 3000...")
     print("Access at: http://localhost:3000/dashboard/")
-    app.run(host='0.0.0.0', port=3000, debug=True)
+    # Debug mode (and its reloader, which re-imports everything in a child process) is opt-in
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    app.run(host='0.0.0.0', port=3000, debug=debug, use_reloader=debug)
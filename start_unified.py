@@ -1,43 +1,31 @@
 #!/usr/bin/env python3
 """
 Unified startup script for both study program and dashboard
-Runs both applications simultaneously on different ports
+Serves both from one interpreter: app.py already mounts the dashboard
+blueprint under /dashboard, so a single WSGI server covers both.
 """
 import os
-import sys
-import threading
-import time
-from pathlib import Path
-
-def start_study_program():
-    """Start the study program on port 3000"""
-    print("🔬 Starting Study Program on port 3000...")
-    os.system("python app.py")
-
-def start_dashboard():
-    """Start the dashboard on port 8080"""
-    print("📊 Starting Dashboard on port 8080...")
-    # Change to dashboard directory
-    os.chdir("dashboard")
-    os.system("python dashboard_app.py")
 
 def main():
     """Main function to start both applications"""
+    port = int(os.environ.get("PORT", 3000))
+    threads = int(os.environ.get("WAITRESS_THREADS", 8))
+
     print("🚀 Starting Unified Face Perception Study System...")
     print("=" * 60)
-    print("🔬 Study Program will run on: http://localhost:3000")
-    print("📊 Dashboard will run on: http://localhost:8080")
+    print(f"🔬 Study Program will run on: http://localhost:{port}")
+    print(f"📊 Dashboard will run on: http://localhost:{port}/dashboard")
     print("=" * 60)
-    
-    # Start study program in a separate thread
-    study_thread = threading.Thread(target=start_study_program, daemon=True)
-    study_thread.start()
-    
-    # Wait a moment for study program to start
-    time.sleep(2)
-    
-    # Start dashboard in main thread
-    start_dashboard()
+
+    from app import app
+
+    try:
+        from waitress import serve
+    except ImportError:
+        print("Waitress not installed - falling back to the Flask development server")
+        app.run(host="0.0.0.0", port=port, debug=False)
+    else:
+        serve(app, host="0.0.0.0", port=port, threads=threads, channel_timeout=60)
 
 if __name__ == "__main__":
     main()
@@ -3,9 +3,6 @@
 Test if we now get all 10 rows per face after fixing the masculinity/femininity skip
 """
 
-import sys
-sys.path.append('.')
-
 from app import convert_dict_to_long_format
 
 # Mock complete face data with all 10 questions
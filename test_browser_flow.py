@@ -3,19 +3,23 @@
 Test the actual browser flow using requests to simulate a complete participant session
 """
 
-import requests
+import csv
+import re
 import time
+from collections import Counter
 from pathlib import Path
 
+from http_test_utils import newest_file, pooled_session, wait_for_csv
+
 BASE_URL = "http://localhost:3000"
-TEST_PID = f"browser_test_{int(time.time())}"
+TEST_PID = f"browser_test_{time.time_ns() // 1_000_000_000}"
+FACE_RE = re.compile(r'Face (\d+) of (\d+)')
+
+session = pooled_session()
 
 def test_complete_flow():
     print(f"🧪 Testing complete browser flow with participant ID: {TEST_PID}")
     
-    # Create a session to maintain cookies
-    session = requests.Session()
-    
     # Step 1: Start the study
     print("\n1. Starting the study...")
     start_data = {"pid": TEST_PID}
@@ -40,8 +44,7 @@ def test_complete_flow():
         else:
             print("❌ Study does not start at Face 1")
             # Look for face number in the response
-            import re
-            face_match = re.search(r'Face (\d+) of (\d+)', task_response.text)
+            face_match = FACE_RE.search(task_response.text)
             if face_match:
                 print(f"   Found: Face {face_match.group(1)} of {face_match.group(2)}")
     else:
@@ -60,9 +63,11 @@ def test_complete_flow():
         'fem_toggle': 'right'
     }
     
-    submit_response = session.post(f"{BASE_URL}/task", data=form_data, allow_redirects=False)
+    # POST /task answers with the next task page (following any redirect),
+    # so that response doubles as step 4's page instead of a separate GET
+    submit_response = session.post(f"{BASE_URL}/task", data=form_data)
     
-    print(f"   Response status: {submit_response.status_code}")
+    print(f"   Response status: {submit_response.status_code} ({submit_response.url})")
     print(f"   Response headers: {dict(submit_response.headers)}")
     if submit_response.text:
         print(f"   Response preview: {submit_response.text[:200]}...")
@@ -74,8 +79,8 @@ def test_complete_flow():
         return
     
     # Step 4: Submit second form (full version)
-    print("\n4. Getting second task page and submitting full version...")
-    task_response2 = session.get(f"{BASE_URL}/task")
+    print("\n4. Using second task page and submitting full version...")
+    task_response2 = submit_response
     
     if task_response2.status_code == 200:
         print("✅ Second task page loaded")
@@ -99,49 +104,48 @@ def test_complete_flow():
     
     # Step 5: Check CSV file creation
     print("\n5. Checking CSV file creation...")
-    time.sleep(2)  # Give it time to save
-    
     data_dir = Path("data/responses")
-    csv_files = list(data_dir.glob(f"*{TEST_PID}*.csv"))
+    # Give it up to 2s to save, but move on as soon as the file shows up
+    csv_files, _ = wait_for_csv(data_dir, TEST_PID, timeout=2)
+    csv_count, latest_file = len(csv_files), newest_file(csv_files)
     
-    if csv_files:
-        print(f"✅ Found {len(csv_files)} CSV files for test participant")
+    if latest_file:
+        print(f"✅ Found {csv_count} CSV files for test participant")
         
         # Check the most recent file
-        latest_file = max(csv_files, key=lambda f: f.stat().st_mtime)
         print(f"✅ Latest CSV file: {latest_file.name}")
         
-        # Verify content
-        with open(latest_file, 'r') as f:
-            content = f.read()
-            lines = content.strip().split('\n')
+        # Verify content, streaming rows instead of splitting the whole file
+        with open(latest_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # One pass: count rows and collect versions (3rd column) as they stream by
+            data_rows = 0
+            versions = []
+            for row in reader:
+                if not row:
+                    continue
+                data_rows += 1
+                if len(row) >= 3:
+                    versions.append(row[2])
+            version_counts = Counter(versions)
             
-            print(f"✅ CSV has {len(lines)} lines (including header)")
+            print(f"✅ CSV has {data_rows + 1} lines (including header)")
             
             # Should have 10 data rows for one complete face
-            data_rows = len(lines) - 1
             if data_rows == 10:
                 print("✅ Correct number of data rows: 10 (one complete face)")
             else:
                 print(f"⚠️ Expected 10 data rows, found: {data_rows}")
             
             # Check for version field
-            if 'version' in lines[0]:
+            if 'version' in header:
                 print("✅ Version field present in CSV header")
                 
-                # Count versions
-                versions = []
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 3:
-                            versions.append(parts[2])  # version is 3rd column
-                
-                version_counts = {v: versions.count(v) for v in set(versions)}
-                print(f"✅ Version distribution: {version_counts}")
+                print(f"✅ Version distribution: {dict(version_counts)}")
                 
                 expected_versions = {'left', 'right', 'both'}
-                found_versions = set(versions)
+                found_versions = version_counts.keys()
                 if expected_versions.issubset(found_versions):
                     print("✅ All expected versions found")
                 else:
@@ -4,7 +4,6 @@ Test complete face submission to verify all 10 questions are saved correctly
 """
 
 import sys
-sys.path.append('.')
 
 from app import convert_dict_to_long_format
 
@@ -39,8 +38,11 @@ print("\nDetailed breakdown:")
 print("PID | Face ID | Version | Question | Response")
 print("-" * 50)
 
-for row in long_rows:
-    print(f"{row['pid']:>3} | {row['face_id']:>7} | {row['version']:>7} | {row['question']:>15} | {row['response']}")
+# Emit the whole table in one write rather than one print per row
+sys.stdout.write("".join(
+    f"{row['pid']:>3} | {row['face_id']:>7} | {row['version']:>7} | {row['question']:>15} | {row['response']}\n"
+    for row in long_rows
+))
 
 # Verify expected structure
 expected_questions = {
@@ -3,19 +3,21 @@
 Comprehensive test to verify the complete study flow and CSV creation
 """
 
-import requests
+import csv
 import time
+from collections import Counter
 from pathlib import Path
 
+from http_test_utils import newest_file, pooled_session, wait_for_csv
+
 BASE_URL = "http://localhost:3000"
-TEST_PID = f"complete_test_{int(time.time())}"
+TEST_PID = f"complete_test_{time.time_ns() // 1_000_000_000}"
+
+session = pooled_session()
 
 def test_complete_study_flow():
     print(f"🧪 Testing complete study flow with participant ID: {TEST_PID}")
     
-    # Create a session to maintain cookies
-    session = requests.Session()
-    
     # Step 1: Start the study
     print("\n1. Starting the study...")
     start_data = {"pid": TEST_PID}
@@ -56,7 +58,9 @@ def test_complete_study_flow():
         'fem_toggle': 'right'
     }
     
-    submit_response1 = session.post(f"{BASE_URL}/task", data=form_data_toggle, allow_redirects=False)
+    # POST /task answers with the next task page (following any redirect),
+    # so that response doubles as step 4's page instead of a separate GET
+    submit_response1 = session.post(f"{BASE_URL}/task", data=form_data_toggle)
     
     if submit_response1.status_code in [200, 302]:
         print("✅ Toggle form submission successful")
@@ -65,8 +69,8 @@ def test_complete_study_flow():
         return False
     
     # Step 4: Get next task page and submit full form
-    print("\n4. Getting next task page and submitting full form...")
-    task_response2 = session.get(f"{BASE_URL}/task")
+    print("\n4. Using next task page and submitting full form...")
+    task_response2 = submit_response1
     
     if task_response2.status_code == 200:
         print("✅ Second task page loaded")
@@ -93,27 +97,38 @@ def test_complete_study_flow():
     
     # Step 5: Wait and check for CSV files
     print("\n5. Checking CSV file creation...")
-    time.sleep(3)  # Give it time to save
-    
     data_dir = Path("data/responses")
-    csv_files = list(data_dir.glob(f"*{TEST_PID}*.csv"))
+    # Give it up to 3s to save, but move on as soon as the file shows up
+    csv_files, _ = wait_for_csv(data_dir, TEST_PID, timeout=3)
+    csv_count, latest_file = len(csv_files), newest_file(csv_files)
     
-    if csv_files:
-        print(f"✅ Found {len(csv_files)} CSV files for test participant")
+    if latest_file:
+        print(f"✅ Found {csv_count} CSV files for test participant")
         
         # Check the most recent file
-        latest_file = max(csv_files, key=lambda f: f.stat().st_mtime)
         print(f"✅ Latest CSV file: {latest_file.name}")
         
-        # Verify content
-        with open(latest_file, 'r') as f:
-            content = f.read()
-            lines = content.strip().split('\n')
+        # Verify content, streaming rows instead of splitting the whole file
+        with open(latest_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # One pass: count rows and collect versions (3rd column) as they stream by
+            data_rows = 0
+            versions = []
+            preview = []
+            for row in reader:
+                if not row:
+                    continue
+                data_rows += 1
+                if len(preview) < 5:
+                    preview.append(row)
+                if len(row) >= 3:
+                    versions.append(row[2])
+            version_counts = Counter(versions)
             
-            print(f"✅ CSV has {len(lines)} lines (including header)")
+            print(f"✅ CSV has {data_rows + 1} lines (including header)")
             
             # Should have 10 data rows for one complete face
-            data_rows = len(lines) - 1
             expected_rows = 10  # 2 left + 2 right + 6 both
             
             if data_rows == expected_rows:
@@ -123,26 +138,16 @@ def test_complete_study_flow():
             
             # Show first few rows
             print("\nCSV content preview:")
-            for i, line in enumerate(lines[:6]):
-                print(f"  {i}: {line}")
+            print("\n".join(f"  {i}: {','.join(row)}" for i, row in enumerate([header] + preview)))
             
             # Check for version field
-            if 'version' in lines[0]:
+            if 'version' in header:
                 print("✅ Version field present in CSV header")
                 
-                # Count versions
-                versions = []
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 3:
-                            versions.append(parts[2])  # version is 3rd column
-                
-                version_counts = {v: versions.count(v) for v in set(versions)}
-                print(f"✅ Version distribution: {version_counts}")
+                print(f"✅ Version distribution: {dict(version_counts)}")
                 
                 expected_versions = {'left', 'right', 'both'}
-                found_versions = set(versions)
+                found_versions = version_counts.keys()
                 if expected_versions.issubset(found_versions):
                     print("✅ All expected versions found")
                     return True
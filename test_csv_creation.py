@@ -3,20 +3,19 @@
 Test CSV creation during form submission by simulating the complete process
 """
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import create_participant_run, save_participant_data, convert_dict_to_long_format
+from app import create_participant_run, save_participant_data_long, convert_dict_to_long_format
+from itertools import islice
 from pathlib import Path
 import json
-from datetime import datetime
+import time
 
 def test_csv_creation_flow():
     print("🧪 Testing complete CSV creation flow...")
     
     # Test participant ID
-    test_pid = f"csv_test_{int(datetime.now().timestamp())}"
+    test_pid = f"csv_test_{time.time_ns() // 1_000_000_000}"
     print(f"Testing with participant ID: {test_pid}")
     
     # Step 1: Create mock session data like the app would
@@ -82,30 +81,32 @@ def test_csv_creation_flow():
         traceback.print_exc()
         return
     
-    # Step 3: Test save_participant_data function
-    print("\n3. Testing save_participant_data...")
+    # Step 3: Test save_participant_data_long function
+    print("\n3. Testing save_participant_data_long...")
     
     try:
-        filepath = save_participant_data(test_pid, mock_responses)
+        filepath = save_participant_data_long(test_pid, mock_responses)
         
-        if filepath and Path(filepath).exists():
+        # open() below already fails loudly if the save did not produce a file
+        if filepath:
             print(f"✅ CSV file created successfully: {filepath}")
             
             # Verify file content
             with open(filepath, 'r') as f:
-                content = f.read()
-                lines = content.strip().split('\n')
+                # Stream: keep the header and a short preview, only count the rest
+                header = next(f, '').rstrip('\n')
+                preview = [line.rstrip('\n') for line in islice(f, 4)]
+                data_rows = len(preview) + sum(1 for _ in f)
                 
-                print(f"✅ CSV file has {len(lines)} lines (including header)")
+                print(f"✅ CSV file has {data_rows + 1} lines (including header)")
                 
                 # Check header
-                if lines and "pid,face_id,version,question,response,timestamp" in lines[0]:
+                if "pid,face_id,version,question,response,timestamp" in header:
                     print("✅ CSV header is correct")
                 else:
-                    print(f"❌ CSV header incorrect. Found: {lines[0] if lines else 'No header'}")
+                    print(f"❌ CSV header incorrect. Found: {header or 'No header'}")
                 
                 # Count data rows (should be 10 for one complete face)
-                data_rows = len(lines) - 1  # Subtract header
                 if data_rows == 10:
                     print(f"✅ Correct number of data rows: {data_rows}")
                 else:
@@ -113,8 +114,7 @@ def test_csv_creation_flow():
                 
                 # Show sample rows
                 print("\nSample CSV content:")
-                for i, line in enumerate(lines[:5]):  # Show first 5 lines
-                    print(f"  {i}: {line}")
+                print("\n".join(f"  {i}: {line}" for i, line in enumerate([header] + preview)))  # Show first 5 lines
                     
         else:
             print("❌ CSV file was not created")
@@ -129,11 +129,18 @@ def test_csv_creation_flow():
     
     data_dir = Path("data/responses")
     if data_dir.exists():
-        csv_files = list(data_dir.glob("*.csv"))
-        print(f"✅ Found {len(csv_files)} CSV files in data/responses/")
+        # One directory pass: count every CSV and pick out the test participant's
+        csv_count = 0
+        recent_files = []
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".csv"):
+                    csv_count += 1
+                    if test_pid in entry.name:
+                        recent_files.append(entry)
+        print(f"✅ Found {csv_count} CSV files in data/responses/")
         
         # Show recent files
-        recent_files = [f for f in csv_files if test_pid in f.name]
         if recent_files:
             print(f"✅ Found {len(recent_files)} files for test participant")
             for f in recent_files:
@@ -5,55 +5,61 @@ This will simulate participant responses and check the CSV format.
 """
 
 import sys
-import os
+from collections import Counter, defaultdict
 from datetime import datetime
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from app import convert_dict_to_long_format
 
-def create_test_responses():
-    """Create test responses in the expected nested dictionary format."""
-    test_responses = {
-        "face(1)": {
-            "left": {
-                "trust_rating": 7,
-                "emotion_rating": 1
-            },
-            "right": {
-                "trust_rating": 9,
-                "emotion_rating": 3
-            },
-            "both": {
-                "masc_choice": "right",
-                "fem_choice": "left", 
-                "trust_q2": 9,
-                "pers_q1": 1,
-                "pers_q2": 3,
-                "trust_rating": 8
-            }
+# Fixed input shared by every call; convert_dict_to_long_format only reads it
+TEST_RESPONSES = {
+    "face(1)": {
+        "left": {
+            "trust_rating": 7,
+            "emotion_rating": 1
+        },
+        "right": {
+            "trust_rating": 9,
+            "emotion_rating": 3
+        },
+        "both": {
+            "masc_choice": "right",
+            "fem_choice": "left", 
+            "trust_q2": 9,
+            "pers_q1": 1,
+            "pers_q2": 3,
+            "trust_rating": 8
+        }
+    },
+    "face(2)": {
+        "left": {
+            "trust_rating": 5,
+            "emotion_rating": 2
         },
-        "face(2)": {
-            "left": {
-                "trust_rating": 5,
-                "emotion_rating": 2
-            },
-            "right": {
-                "trust_rating": 6,
-                "emotion_rating": 4
-            },
-            "both": {
-                "masc_choice": "left",
-                "fem_choice": "right",
-                "trust_q2": 7,
-                "pers_q1": 3,
-                "pers_q2": 5,
-                "trust_rating": 6
-            }
+        "right": {
+            "trust_rating": 6,
+            "emotion_rating": 4
+        },
+        "both": {
+            "masc_choice": "left",
+            "fem_choice": "right",
+            "trust_q2": 7,
+            "pers_q1": 3,
+            "pers_q2": 5,
+            "trust_rating": 6
         }
     }
-    return test_responses
+}
+
+def create_test_responses():
+    """Return the test responses in the expected nested dictionary format."""
+    return TEST_RESPONSES
+
+def format_sample_rows(rows):
+    """Render rows as CSV lines, joined so they can be written in one call."""
+    return "".join(
+        f"{row['pid']},{row['face_id']},{row['version']},{row['question']},{row['response']},{row['timestamp']}\n"
+        for row in rows
+    )
 
 def test_csv_conversion():
     """Test the CSV conversion function."""
@@ -72,6 +78,17 @@ def test_csv_conversion():
     # Convert to long format
     long_responses = convert_dict_to_long_format(participant_id, test_responses)
     
+    # One pass: group rows by face, tally versions and count empty version fields
+    rows_by_face = defaultdict(list)
+    version_counts = Counter()
+    empty_versions = 0
+    for row in long_responses:
+        rows_by_face[row['face_id']].append(row)
+        version = row['version']
+        version_counts[version] += 1
+        if not version:
+            empty_versions += 1
+    
     print(f"\n✅ Conversion Results:")
     print(f"   Total rows: {len(long_responses)}")
     print(f"   Expected: 20 rows (2 faces × 10 questions each)")
@@ -81,23 +98,21 @@ def test_csv_conversion():
         print(f"\n📋 Sample CSV rows:")
         print("pid,face_id,version,question,response,timestamp")
         
-        face1_rows = [row for row in long_responses if row['face_id'] == 'face(1)']
-        face2_rows = [row for row in long_responses if row['face_id'] == 'face(2)']
+        face1_rows = rows_by_face['face(1)']
+        face2_rows = rows_by_face['face(2)']
         
         print(f"\n🎯 Face(1) - {len(face1_rows)} rows:")
-        for row in face1_rows[:5]:  # Show first 5
-            print(f"{row['pid']},{row['face_id']},{row['version']},{row['question']},{row['response']},{row['timestamp']}")
+        sys.stdout.write(format_sample_rows(face1_rows[:5]))  # Show first 5
         if len(face1_rows) > 5:
             print("...")
             
         print(f"\n🎯 Face(2) - {len(face2_rows)} rows:")
-        for row in face2_rows[:5]:  # Show first 5
-            print(f"{row['pid']},{row['face_id']},{row['version']},{row['question']},{row['response']},{row['timestamp']}")
+        sys.stdout.write(format_sample_rows(face2_rows[:5]))  # Show first 5
         if len(face2_rows) > 5:
             print("...")
     
     # Validate version field
-    versions_found = set(row['version'] for row in long_responses)
+    versions_found = set(version_counts)
     expected_versions = {'left', 'right', 'both'}
     
     print(f"\n🔍 Version Validation:")
@@ -106,15 +121,14 @@ def test_csv_conversion():
     print(f"   ✅ All versions present: {expected_versions.issubset(versions_found)}")
     
     # Check for empty version fields
-    empty_versions = [row for row in long_responses if not row['version'] or row['version'] == '']
-    print(f"   ❌ Empty version fields: {len(empty_versions)}")
+    print(f"   ❌ Empty version fields: {empty_versions}")
     
-    if len(empty_versions) == 0:
+    if empty_versions == 0:
         print("   ✅ NO EMPTY VERSION FIELDS - FIX SUCCESSFUL!")
     else:
         print("   ❌ STILL HAS EMPTY VERSION FIELDS - FIX FAILED!")
         
-    return len(long_responses), len(empty_versions) == 0
+    return len(long_responses), empty_versions == 0
 
 if __name__ == "__main__":
     print("🚨 CRITICAL CSV FORMAT TEST - Study launches tomorrow!")
@@ -3,19 +3,15 @@
 Simple test to verify CSV creation works
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from app import save_participant_data, convert_dict_to_long_format
-from pathlib import Path
+from app import save_participant_data_long, convert_dict_to_long_format
+from itertools import islice
 import time
 
 def test_csv_creation():
     print("🧪 Testing CSV creation directly...")
     
     # Test data in the format the app uses
-    test_pid = f"direct_csv_test_{int(time.time())}"
+    test_pid = f"direct_csv_test_{time.time_ns() // 1_000_000_000}"
     
     # Mock session responses structure
     mock_responses = {
@@ -43,22 +39,24 @@ def test_csv_creation():
     
     print(f"Testing with participant ID: {test_pid}")
     
-    # Test save_participant_data directly
+    # Test save_participant_data_long directly
     try:
-        filepath = save_participant_data(test_pid, mock_responses)
+        filepath = save_participant_data_long(test_pid, mock_responses)
         
-        if filepath and Path(filepath).exists():
+        # open() below already fails loudly if the save did not produce a file
+        if filepath:
             print(f"✅ CSV file created: {filepath}")
             
             # Check content
             with open(filepath, 'r') as f:
-                content = f.read()
-                lines = content.strip().split('\n')
-                print(f"✅ CSV has {len(lines)} lines (including header)")
+                # Stream: keep the header and a short preview, only count the rest
+                header = next(f, '').rstrip('\n')
+                preview = [line.rstrip('\n') for line in islice(f, 4)]
+                data_rows = len(preview) + sum(1 for _ in f)
+                print(f"✅ CSV has {data_rows + 1} lines (including header)")
                 
                 # Show first few lines
-                for i, line in enumerate(lines[:5]):
-                    print(f"  {i}: {line}")
+                print("\n".join(f"  {i}: {line}" for i, line in enumerate([header] + preview)))
                     
                 return True
         else:
@@ -3,10 +3,6 @@
 Test dashboard loading with long-format data
 """
 
-import sys
-sys.path.append('.')
-sys.path.append('dashboard')
-
 from dashboard.analysis.cleaning import DataCleaner
 
 def test_dashboard_loading():
@@ -32,11 +28,30 @@ def test_dashboard_loading():
             
             # Test specific long-format structure
             if 'question' in cleaned_data.columns and 'response' in cleaned_data.columns:
+                # One grouped scan yields both the question and version breakdowns
+                counts = cleaned_data.groupby(['question', 'version'], observed=True, dropna=False).size()
+                
                 print('\nQuestion types found:')
-                print(cleaned_data['question'].value_counts())
+                print(counts.groupby(level='question').sum().sort_values(ascending=False))
                 
                 print('\nVersion breakdown:')
-                print(cleaned_data['version'].value_counts())
+                print(counts.groupby(level='version').sum().sort_values(ascending=False))
+            
+            # The categorical load path must see exactly the same data
+            compact = DataCleaner()
+            compact.load_data(categorical=True)
+            compact_data = compact.get_cleaned_data()
+            same_shape = len(compact_data) == len(cleaned_data)
+            same_participants = compact_data['pid'].nunique() == cleaned_data['pid'].nunique() if 'pid' in cleaned_data.columns else True
+            same_questions = (
+                'question' not in cleaned_data.columns
+                or compact_data['question'].value_counts().sort_index().equals(cleaned_data['question'].value_counts().sort_index())
+            )
+            if same_shape and same_participants and same_questions:
+                print('\n✅ Categorical load matches the default load')
+            else:
+                print('\n❌ Categorical load differs from the default load')
+                return False
                 
         return True
         
@@ -3,18 +3,23 @@
 Test direct POST submission to isolate the issue
 """
 
-import requests
+import re
 import time
+from pathlib import Path
+
+from http_test_utils import pooled_session, wait_for_csv
 
 BASE_URL = "http://localhost:3000"
 TEST_PID = f"direct_test_{int(time.time())}"
+FACE_RE = re.compile(r'Face (\d+) of (\d+)')
+
+session = pooled_session()
 
 def test_direct_post():
     print(f"🧪 Testing direct POST submission with participant ID: {TEST_PID}")
     
     # Step 1: Start session and get cookies
     print("\n1. Starting session...")
-    session = requests.Session()
     
     # Start the study
     start_data = {"pid": TEST_PID}
@@ -57,18 +62,14 @@ def test_direct_post():
     
     # Check if response contains task page or redirect
     if "Face" in post_response.text and "of" in post_response.text:
-        import re
-        face_match = re.search(r'Face (\d+) of (\d+)', post_response.text)
+        face_match = FACE_RE.search(post_response.text)
         if face_match:
             print(f"Response shows: Face {face_match.group(1)} of {face_match.group(2)}")
     
     # Step 4: Check for CSV files
     print("\n4. Checking for CSV files...")
-    time.sleep(1)
-    
-    from pathlib import Path
     data_dir = Path("data/responses")
-    csv_files = list(data_dir.glob(f"*{TEST_PID}*.csv"))
+    csv_files, all_csv = wait_for_csv(data_dir, TEST_PID)
     
     if csv_files:
         print(f"✅ Found CSV files: {[f.name for f in csv_files]}")
@@ -76,8 +77,7 @@ def test_direct_post():
         print("❌ No CSV files found")
         
         # List all CSV files to see what exists
-        all_csv = list(data_dir.glob("*.csv"))
-        print(f"All CSV files in directory: {[f.name for f in all_csv]}")
+        print(f"All CSV files in directory: {all_csv}")
 
 if __name__ == "__main__":
     test_direct_post()
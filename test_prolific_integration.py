@@ -4,17 +4,20 @@ Test script to verify complete Prolific PID integration end-to-end.
 Tests URL parameter extraction, form submission, and CSV export with Prolific PIDs.
 """
 
-import requests
-import time
 from pathlib import Path
 import csv
-import os
+
+from http_test_utils import pooled_session, wait_for_csv
 
 # Test configuration
 BASE_URL = "http://localhost:3000"
 TEST_PROLIFIC_PID = "TEST_PROLIFIC_123"
 TEST_PARTICIPANT_ID = "test_participant_456"
 
+# One pooled keep-alive session shared by the main and fallback participants;
+# the cookie jar is cleared between them so each still gets its own Flask session
+session = pooled_session()
+
 def test_prolific_integration():
     """Test complete Prolific PID integration flow."""
     
@@ -29,7 +32,8 @@ def test_prolific_integration():
         'prolific_pid': TEST_PROLIFIC_PID
     }
     
-    session = requests.Session()
+    # Cheap warm-up so the connection is already open for the POSTs below
+    session.get(f"{BASE_URL}/", allow_redirects=False)
     response = session.post(f"{BASE_URL}/start", data=start_data)
     
     if response.status_code == 200:
@@ -66,21 +70,18 @@ def test_prolific_integration():
     # Test 3: Check if CSV file was created with correct Prolific PID
     print("\n3. Testing CSV file creation with Prolific PID...")
     
-    # Wait a moment for file creation
-    time.sleep(1)
-    
     # Look for CSV files in data/responses directory
     responses_dir = Path("data/responses")
     if not responses_dir.exists():
         print(f"❌ Responses directory does not exist: {responses_dir}")
         return False
     
-    # Find CSV files with our test Prolific PID
-    csv_files = list(responses_dir.glob(f"*{TEST_PROLIFIC_PID}*.csv"))
+    # Find CSV files with our test Prolific PID, waiting briefly for the save
+    csv_files, available = wait_for_csv(responses_dir, TEST_PROLIFIC_PID)
     
     if not csv_files:
         print(f"❌ No CSV files found with Prolific PID {TEST_PROLIFIC_PID}")
-        print(f"   Available files: {list(responses_dir.glob('*.csv'))}")
+        print(f"   Available files: {available}")
         return False
     
     print(f"✅ Found CSV file: {csv_files[0].name}")
@@ -91,15 +92,18 @@ def test_prolific_integration():
     csv_file = csv_files[0]
     try:
         with open(csv_file, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+            # Only the header and first row are inspected; the rest is just counted
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            first = next(reader, None)
             
-            if not rows:
+            if first is None:
                 print(f"❌ CSV file is empty")
                 return False
+            row_count = 1 + sum(1 for _ in reader)
             
             # Check if pid field contains our Prolific PID
-            first_row = rows[0]
+            first_row = dict(zip(headers, first))
             if 'pid' not in first_row:
                 print(f"❌ CSV missing 'pid' column")
                 return False
@@ -118,8 +122,8 @@ def test_prolific_integration():
                 print(f"❌ CSV missing required columns: {missing_columns}")
                 return False
             
-            print(f"✅ CSV has all required columns: {list(first_row.keys())}")
-            print(f"✅ CSV has {len(rows)} response rows")
+            print(f"✅ CSV has all required columns: {headers}")
+            print(f"✅ CSV has {row_count} response rows")
             
     except Exception as e:
         print(f"❌ Error reading CSV file: {e}")
@@ -128,19 +132,20 @@ def test_prolific_integration():
     # Test 5: Test fallback behavior (no Prolific PID)
     print("\n5. Testing fallback behavior (no Prolific PID)...")
     
-    fallback_session = requests.Session()
+    # Same pooled connection, fresh cookies: the fallback is a separate participant
+    session.cookies.clear()
     fallback_data = {
         'pid': 'fallback_test_789',
         'prolific_pid': ''  # Empty Prolific PID
     }
     
-    fallback_response = fallback_session.post(f"{BASE_URL}/start", data=fallback_data)
+    fallback_response = session.post(f"{BASE_URL}/start", data=fallback_data)
     
     if fallback_response.status_code == 200:
         print(f"✅ Fallback session started successfully")
         
         # Submit one form to test fallback CSV creation
-        task_response = fallback_session.get(f"{BASE_URL}/task")
+        task_response = session.get(f"{BASE_URL}/task")
         if task_response.status_code == 200:
             fallback_form = {
                 'version': 'right',
@@ -149,7 +154,7 @@ def test_prolific_integration():
                 'prolific_pid': ''  # Empty
             }
             
-            form_response = fallback_session.post(f"{BASE_URL}/task", data=fallback_form)
+            form_response = session.post(f"{BASE_URL}/task", data=fallback_form)
             if form_response.status_code == 200:
                 print(f"✅ Fallback form submitted successfully")
             else:
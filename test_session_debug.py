@@ -3,12 +3,31 @@
 Debug script to test session initialization and verify Face 1 start behavior
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
+import app
 from app import create_participant_run, FACE_FILES
 import random
+from unittest import mock
+
+# Mock session object
+class MockSession:
+    def __init__(self):
+        self.data = {}
+        
+    def clear(self):
+        self.data.clear()
+        print("🔄 Session cleared")
+        
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        
+    def __getitem__(self, key):
+        return self.data[key]
+        
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+        
+    def __contains__(self, key):
+        return key in self.data
 
 def test_session_creation():
     print("🧪 Testing session creation and face ordering...")
@@ -20,33 +39,11 @@ def test_session_creation():
         # Set a fixed seed for reproducible testing
         random.seed(42 + i)
         
-        # Mock session object
-        class MockSession:
-            def __init__(self):
-                self.data = {}
-                
-            def clear(self):
-                self.data.clear()
-                print("🔄 Session cleared")
-                
-            def __setitem__(self, key, value):
-                self.data[key] = value
-                
-            def __getitem__(self, key):
-                return self.data[key]
-                
-            def get(self, key, default=None):
-                return self.data.get(key, default)
-        
         # Create mock session
         session = MockSession()
         
-        # Monkey patch the global session for testing
-        import app
-        original_session = app.session
-        app.session = session
-        
-        try:
+        # Swap in the mock for app's global session; patch.object restores it even on errors
+        with mock.patch.object(app, "session", session):
             # Test participant creation
             test_pid = f"test_participant_{i+1}"
             create_participant_run(test_pid)
@@ -68,10 +65,6 @@ def test_session_creation():
                 print("✅ Session index correctly starts at 0")
             else:
                 print(f"❌ Session index starts at {session['index']} instead of 0")
-                
-        finally:
-            # Restore original session
-            app.session = original_session
 
 def test_face_calculation():
     print("\n🧪 Testing face number calculation...")
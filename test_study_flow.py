@@ -7,21 +7,23 @@ Tests:
 3. Session management works correctly
 """
 
-import requests
 import time
-import os
 from pathlib import Path
 
+from http_test_utils import pooled_session, wait_for_csv
+
 BASE_URL = "http://localhost:3000"
 TEST_PID = f"test_flow_{int(time.time())}"
 
+session = pooled_session()
+
 def test_study_flow():
     print(f"🧪 Testing study flow with participant ID: {TEST_PID}")
     
     # Test 1: Start the study
     print("\n1. Testing study start...")
     start_data = {"pid": TEST_PID}
-    start_response = requests.post(f"{BASE_URL}/start", data=start_data)
+    start_response = session.post(f"{BASE_URL}/start", data=start_data)
     if start_response.status_code in [200, 302]:  # 302 is redirect to /task
         print("✅ Study start successful")
     else:
@@ -30,7 +32,7 @@ def test_study_flow():
     
     # Test 2: Get the first task page
     print("\n2. Testing first task page...")
-    task_response = requests.get(f"{BASE_URL}/task")
+    task_response = session.get(f"{BASE_URL}/task")
     if task_response.status_code == 200:
         # Check if it shows "Face 1 of 35"
         if "Face 1 of" in task_response.text:
@@ -54,7 +56,7 @@ def test_study_flow():
         'fem_toggle': 'right'
     }
     
-    submit_response = requests.post(f"{BASE_URL}/task", data=form_data)
+    submit_response = session.post(f"{BASE_URL}/task", data=form_data)
     if submit_response.status_code in [200, 302]:  # 302 is redirect
         print("✅ Form submission successful")
     else:
@@ -63,10 +65,8 @@ def test_study_flow():
     
     # Test 4: Check if CSV file was created
     print("\n4. Testing CSV file creation...")
-    time.sleep(2)  # Give it a moment to save
-    
     data_dir = Path("data/responses")
-    csv_files = list(data_dir.glob(f"{TEST_PID}*.csv"))
+    csv_files, _ = wait_for_csv(data_dir, TEST_PID)
     
     if csv_files:
         print(f"✅ CSV file created: {csv_files[0].name}")
@@ -3,9 +3,6 @@
 Test wide format conversion to verify it's actually wide (not duplicate long)
 """
 
-import sys
-sys.path.append('.')
-
 from app import convert_dict_to_wide_template
 
 # Mock complete face data with all 10 questions
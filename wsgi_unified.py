@@ -2,14 +2,17 @@
 """
 WSGI application for unified deployment on Render
 Serves both study program and dashboard from single Flask app
+
+Run directly it serves with Waitress; pass --dev for werkzeug's dev server.
+Under gunicorn: gunicorn -w 4 -k gthread --threads 8 wsgi_unified:application
 """
 import os
 import sys
 from pathlib import Path
 from werkzeug.serving import run_simple
 
-# Add current directory to Python path
-current_dir = Path(__file__).resolve().parent
+# Add current directory to Python path (absolute() skips resolve()'s symlink lookups)
+current_dir = Path(__file__).absolute().parent
 sys.path.insert(0, str(current_dir))
 
 # Import the main application (which already has dashboard blueprint registered)
@@ -19,7 +22,6 @@ from app import app
 application = app
 
 if __name__ == "__main__":
-    # For local development
     print("🚀 Starting Unified Face Perception Study System...")
     print("=" * 60)
     print("🔬 Study Program: http://localhost:3000")
@@ -29,7 +31,25 @@ if __name__ == "__main__":
     # Use Render's PORT if available, otherwise 3000
     port = int(os.environ.get('PORT', 3000))
     
-    run_simple('0.0.0.0', port, application, 
-               use_reloader=True, 
-               use_debugger=True,
-               threaded=True)
+    # Debugger and reloader are opt-in via FLASK_DEBUG=1
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    # Waitress serves by default; --dev (or FLASK_DEBUG=1) keeps werkzeug's dev server
+    use_dev_server = debug or '--dev' in sys.argv[1:]
+    threads = int(os.environ.get('WAITRESS_THREADS', 8))
+    
+    if not use_dev_server:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("Waitress not installed - falling back to the development server")
+            use_dev_server = True
+    
+    if use_dev_server:
+        run_simple('0.0.0.0', port, application, 
+                   use_reloader=debug, 
+                   use_debugger=debug,
+                   threaded=True)
+    else:
+        print(f"Serving with Waitress ({threads} threads)")
+        serve(application, host='0.0.0.0', port=port, threads=threads,
+              connection_limit=200, channel_timeout=60)